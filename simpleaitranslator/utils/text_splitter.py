@@ -1,5 +1,35 @@
 import re
 
+import tiktoken
+
+_ENCODINGS = {}
+WORDS_PER_TOKEN = 0.75
+# Sentence-ending characters for the boundary search: ASCII plus the CJK
+# fullwidth forms, so Chinese/Japanese text splits at 。！？ instead of
+# falling through to a hard cut every time
+SENTENCE_BOUNDARIES = ".!?\n。！？"
+
+
+def _get_encoding(model_name):
+    # tiktoken fetches its token tables over the network on first use; cache the
+    # encoding per model and remember failures so offline runs don't retry forever
+    if model_name not in _ENCODINGS:
+        try:
+            _ENCODINGS[model_name] = tiktoken.encoding_for_model(model_name)
+        except Exception:
+            _ENCODINGS[model_name] = None
+    return _ENCODINGS[model_name]
+
+
+
+def _is_character_safe_cut(encoding, tokens, index):
+    # tiktoken tokens are byte level, so a cut can land between the bytes of one
+    # multi-byte character; decoding each side separately then matches the
+    # across-the-seam decode only when no character was split (tiktoken decodes
+    # partial sequences to U+FFFD)
+    before = tokens[max(0, index - 4):index]
+    after = tokens[index:index + 4]
+    return encoding.decode(before) + encoding.decode(after) == encoding.decode(before + after)
 
 
 def get_first_n_words(text: str, n_words) -> str:
@@ -46,4 +76,82 @@ def split_text_to_chunks(text, max_lenght):
         if word != splited_text[index]:
             print("Error Error")
 
-    return [" ".join(chunk) for chunk in chunks_of_text]
\ No newline at end of file
+    return [" ".join(chunk) for chunk in chunks_of_text]
+
+
+def split_text_to_chunks_tokens(text, max_tokens, model_name, with_separators=False):
+    """
+    Splits text into chunks sized by the model's real token budget instead of a
+    word count. Chunks are cut at the nearest sentence boundary inside the last
+    20% of the budget, so they stay full without overflowing. Falls back to the
+    word-count splitter when the tiktoken encoding is unavailable (e.g. offline).
+
+    With with_separators=True also returns the list of original between-chunk
+    separators (newlines, paragraph breaks), so the translated chunks can be
+    rejoined without flattening document structure to single spaces.
+    """
+    encoding = _get_encoding(model_name)
+    if encoding is None:
+        chunks_of_text = split_text_to_chunks(text, max(1, int(max_tokens * WORDS_PER_TOKEN)))
+        if with_separators:
+            # The word-count splitter already collapses whitespace, so single
+            # spaces are the best separators available on this path
+            return chunks_of_text, [" "] * max(0, len(chunks_of_text) - 1)
+        return chunks_of_text
+
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        if with_separators:
+            return [text], []
+        return [text]
+
+    raw_chunks = []
+    min_chunk_tokens = int(max_tokens * 0.8)
+    start = 0
+    while start < len(tokens):
+        end = min(start + max_tokens, len(tokens))
+        if end < len(tokens):
+            # Walk back through the last 20% of the window looking for a token
+            # that ends a sentence
+            for index in range(end, start + min_chunk_tokens, -1):
+                piece = encoding.decode(tokens[index - 1:index])
+                if any(boundary in piece for boundary in SENTENCE_BOUNDARIES) \
+                        and _is_character_safe_cut(encoding, tokens, index):
+                    end = index
+                    break
+            else:
+                # No sentence boundary in the window: snap the hard cut back
+                # until it no longer lands inside a multi-byte character
+                while end > start + 1 and not _is_character_safe_cut(encoding, tokens, end):
+                    end -= 1
+        raw_chunks.append(encoding.decode(tokens[start:end]))
+        start = end
+
+    chunks_of_text = [raw_chunk.strip() for raw_chunk in raw_chunks]
+    if not with_separators:
+        return chunks_of_text
+
+    # The separator between two chunks is whatever whitespace the strip() calls
+    # removed around the cut: the trailing whitespace of one raw chunk plus the
+    # leading whitespace of the next. A cut with no adjacent whitespace gets an
+    # empty separator so join_chunks round-trips the source exactly
+    separators = []
+    for index in range(len(raw_chunks) - 1):
+        trailing = raw_chunks[index][len(raw_chunks[index].rstrip()):]
+        leading = raw_chunks[index + 1][:len(raw_chunks[index + 1]) - len(raw_chunks[index + 1].lstrip())]
+        separators.append(trailing + leading)
+    return chunks_of_text, separators
+
+
+def join_chunks(chunks, separators):
+    """
+    Rejoins chunks with the separators captured by split_text_to_chunks_tokens,
+    preserving the original paragraph/newline structure in O(n).
+    """
+    if not chunks:
+        return ""
+    pieces = [chunks[0]]
+    for chunk, separator in zip(chunks[1:], separators):
+        pieces.append(separator)
+        pieces.append(chunk)
+    return "".join(pieces)
\ No newline at end of file
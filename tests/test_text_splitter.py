@@ -1,6 +1,16 @@
-from simpleaitranslator.utils.text_splitter import get_first_n_words, split_text_to_chunks
+from simpleaitranslator.utils import text_splitter
+from simpleaitranslator.utils.text_splitter import get_first_n_words, split_text_to_chunks, split_text_to_chunks_tokens, join_chunks
 import pytest
 
+
+class FakeEncoding:
+    # One token per character, so token budgets are easy to reason about in tests
+    def encode(self, text):
+        return [ord(char) for char in text]
+
+    def decode(self, tokens):
+        return "".join(chr(token) for token in tokens)
+
 def test_get_first_n_words():
     # Test with a regular string
     assert get_first_n_words("This is a test sentence.", 3) == "This is a"
@@ -126,3 +136,76 @@ def test_split_text_to_chunks_exact_match_length_last_comma():
         "Exact match length sentence,"
     ]
     assert split_text_to_chunks(text, max_length) == expected_output
+
+
+def test_split_text_to_chunks_tokens_short_text_single_chunk():
+    text_splitter._ENCODINGS["fake-model"] = FakeEncoding()
+    text = "Short sentence."
+    assert split_text_to_chunks_tokens(text, 100, "fake-model") == [text]
+
+
+def test_split_text_to_chunks_tokens_cuts_at_sentence_boundary():
+    text_splitter._ENCODINGS["fake-model"] = FakeEncoding()
+    text = "First sentence is here. Second sentence is here."
+    result = split_text_to_chunks_tokens(text, 28, "fake-model")
+    assert result == ["First sentence is here.", "Second sentence is here."]
+
+
+def test_split_text_to_chunks_tokens_roundtrip():
+    text_splitter._ENCODINGS["fake-model"] = FakeEncoding()
+    text = "One. Two. Three. Four. Five. Six. Seven. Eight. Nine. Ten."
+    result = split_text_to_chunks_tokens(text, 25, "fake-model")
+    assert " ".join(result) == text
+
+
+def test_split_text_to_chunks_tokens_falls_back_without_encoding():
+    text_splitter._ENCODINGS["missing-model"] = None
+    text = "This is a sentence. Another sentence follows."
+    expected = split_text_to_chunks(text, max(1, int(8 * text_splitter.WORDS_PER_TOKEN)))
+    assert split_text_to_chunks_tokens(text, 8, "missing-model") == expected
+
+
+def test_split_text_to_chunks_tokens_separators_roundtrip():
+    text_splitter._ENCODINGS["fake-model"] = FakeEncoding()
+    text = "First paragraph one.\n\nSecond paragraph two."
+    chunks, separators = split_text_to_chunks_tokens(text, 25, "fake-model", True)
+    assert chunks == ["First paragraph one.", "Second paragraph two."]
+    assert separators == ["\n\n"]
+    assert join_chunks(chunks, separators) == text
+
+
+def test_join_chunks_empty():
+    assert join_chunks([], []) == ""
+
+
+class ByteFakeEncoding:
+    # One token per UTF-8 byte, mimicking tiktoken's byte-level tokens so cuts
+    # can land inside a multi-byte character
+    def encode(self, text):
+        return list(text.encode("utf-8"))
+
+    def decode(self, tokens):
+        return bytes(tokens).decode("utf-8", errors="replace")
+
+
+def test_split_text_to_chunks_tokens_cuts_at_cjk_boundary():
+    text_splitter._ENCODINGS["fake-model"] = FakeEncoding()
+    text = "一二三。四五六。"
+    result = split_text_to_chunks_tokens(text, 4, "fake-model")
+    assert result == ["一二三。", "四五六。"]
+
+
+def test_split_text_to_chunks_tokens_hard_cut_is_character_safe():
+    text_splitter._ENCODINGS["byte-model"] = ByteFakeEncoding()
+    text = "一二三四五六"
+    chunks, separators = split_text_to_chunks_tokens(text, 7, "byte-model", True)
+    assert all("�" not in chunk for chunk in chunks)
+    assert join_chunks(chunks, separators) == text
+
+
+def test_split_text_to_chunks_tokens_no_fabricated_separator():
+    text_splitter._ENCODINGS["fake-model"] = FakeEncoding()
+    text = "abc.def.ghi"
+    chunks, separators = split_text_to_chunks_tokens(text, 5, "fake-model", True)
+    assert separators == ["", ""]
+    assert join_chunks(chunks, separators) == text
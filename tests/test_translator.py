@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from unittest.mock import AsyncMock, patch
 from simpleaitranslator.exceptions import MissingAPIKeyError, NoneAPIKeyProvidedError, InvalidModelName
@@ -36,6 +38,52 @@ class TestTranslatorOpenAI:
         result = await translator.translate_chunk_of_text("text", "en")
         assert result == "translated text"
 
+    @pytest.mark.asyncio
+    async def test_async_translate_batch(self, translator):
+        translator.client = AsyncMock()
+        translator.client.files.create = AsyncMock(return_value=AsyncMock(id="file-1"))
+        translator.client.batches.create = AsyncMock(return_value=AsyncMock(
+            id="batch-1", status="completed", output_file_id="file-2"))
+        output_line = json.dumps({
+            "custom_id": "t0-c0",
+            "response": {"body": {"choices": [{"message": {"content": "translated text"}}]}}
+        })
+        translator.client.files.content = AsyncMock(return_value=AsyncMock(text=output_line))
+
+        result = await translator.async_translate_batch(["Hello world"], "en")
+
+        assert result == ["translated text"]
+        translator.client.batches.create.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_translate_batch_retries_failed_requests(self, translator):
+        # One request errored inside the batch, so its chunk should be
+        # re-translated through the regular endpoint instead of raising KeyError
+        translator.client = AsyncMock()
+        translator.client.files.create = AsyncMock(return_value=AsyncMock(id="file-1"))
+        translator.client.batches.create = AsyncMock(return_value=AsyncMock(
+            id="batch-1", status="completed", output_file_id="file-2"))
+        output_lines = "\n".join([
+            json.dumps({
+                "custom_id": "t0-c0",
+                "response": {"body": {"choices": [{"message": {"content": "translated text"}}]}}
+            }),
+            json.dumps({
+                "custom_id": "t1-c0",
+                "error": {"message": "rate limited"},
+                "response": {"body": {}}
+            }),
+        ])
+        translator.client.files.content = AsyncMock(return_value=AsyncMock(text=output_lines))
+        translator.client.beta.chat.completions.parse = AsyncMock(return_value=AsyncMock(
+            choices=[AsyncMock(message=AsyncMock(parsed=AsyncMock(translated_text="retried text")))]
+        ))
+
+        result = await translator.async_translate_batch(["Hello world", "Second text"], "en")
+
+        assert result == ["translated text", "retried text"]
+        translator.client.beta.chat.completions.parse.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_translate_chunk_of_text_no_client(self):
         translator = TranslatorOpenAI(open_ai_api_key="test_key")
@@ -83,8 +131,8 @@ class TestTranslatorMethods:
     @pytest.mark.asyncio
     async def test_async_get_text_language(self, translator):
         translator.client = AsyncMock()
-        translator.client.beta.chat.completions.parse = AsyncMock(return_value=AsyncMock(
-            choices=[AsyncMock(message=AsyncMock(parsed=AsyncMock(language_ISO_639_1_code="en")))]
+        translator.client.chat.completions.create = AsyncMock(return_value=AsyncMock(
+            choices=[AsyncMock(message=AsyncMock(content='{"language_ISO_639_1_code": "en"}'))]
         ))
 
         result = await translator.async_get_text_language("Hello world")
@@ -103,19 +151,35 @@ class TestTranslatorMethods:
 
     @pytest.mark.asyncio
     async def test_async_translate_text(self, translator):
-        # Mocking the client and the response for translate_chunk_of_text
+        # Mocking the client and the batched response for translate_many
         translator.client = AsyncMock()
         translator.client.beta.chat.completions.parse = AsyncMock(return_value=AsyncMock(
-            choices=[AsyncMock(message=AsyncMock(parsed=AsyncMock(translated_text="translated text")))]
+            choices=[AsyncMock(message=AsyncMock(parsed=AsyncMock(
+                translations=[AsyncMock(translated_text="translated text", number_of_languages=1)]
+            )))]
         ))
 
-        # Mocking the how_many_languages_are_in_text to return an integer
-        translator.how_many_languages_are_in_text = AsyncMock(return_value=1)
-
         result = await translator.async_translate_text("Hello world", "en")
 
         assert result == "translated text"
 
+    @pytest.mark.asyncio
+    async def test_translate_many_falls_back_on_length_mismatch(self, translator):
+        # The batched call returns an empty array, so translate_many should retry
+        # with one translate_and_count request per chunk
+        translator.client = AsyncMock()
+        translator.client.beta.chat.completions.parse = AsyncMock(return_value=AsyncMock(
+            choices=[AsyncMock(message=AsyncMock(parsed=AsyncMock(
+                translations=[], translated_text="translated text", number_of_languages=1
+            )))]
+        ))
+
+        result = await translator.translate_many(["Hello world"], "en")
+
+        assert len(result) == 1
+        assert result[0].translated_text == "translated text"
+        assert translator.client.beta.chat.completions.parse.call_count == 2
+
     def test_translate(self, translator):
         with patch.object(TranslatorOpenAI, 'async_translate_text', return_value="translated text") as mock_async_method:
             result = translator.translate("Hello world", "en")
@@ -123,11 +187,50 @@ class TestTranslatorMethods:
             mock_async_method.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_how_many_languages_are_in_text(self, translator):
+    async def test_translate_inside_running_loop(self, translator):
+        # The sync wrapper must not raise when called from an async context; the
+        # real pipeline runs on the background loop with only the client mocked
         translator.client = AsyncMock()
         translator.client.beta.chat.completions.parse = AsyncMock(return_value=AsyncMock(
-            choices=[AsyncMock(message=AsyncMock(parsed=AsyncMock(number_of_languages=2)))]
+            choices=[AsyncMock(message=AsyncMock(parsed=AsyncMock(
+                translations=[AsyncMock(translated_text="translated text", number_of_languages=1)]
+            )))]
         ))
 
-        result = await translator.how_many_languages_are_in_text("Hello world")
+        result = translator.translate("Hello world", "en")
+
+        assert result == "translated text"
+
+    @pytest.mark.asyncio
+    async def test_translate_chunk_of_text_is_cached(self, translator):
+        translator.client = AsyncMock()
+        translator.client.beta.chat.completions.parse = AsyncMock(return_value=AsyncMock(
+            choices=[AsyncMock(message=AsyncMock(parsed=AsyncMock(translated_text="translated text")))]
+        ))
+
+        first = await translator.translate_chunk_of_text("text", "en")
+        second = await translator.translate_chunk_of_text("text", "en")
+
+        assert first == "translated text"
+        assert second == "translated text"
+        translator.client.beta.chat.completions.parse.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_how_many_languages_are_in_text(self, translator):
+        translator.client = AsyncMock()
+        translator.client.chat.completions.create = AsyncMock(return_value=AsyncMock(
+            choices=[AsyncMock(message=AsyncMock(content='{"number_of_languages": 2}'))]
+        ))
+
+        # Mixed Latin and Cyrillic scripts, so the heuristic defers to the LLM
+        result = await translator.how_many_languages_are_in_text("Hello мир")
         assert result == 2
+
+    @pytest.mark.asyncio
+    async def test_how_many_languages_skips_llm_for_single_script(self, translator):
+        translator.client = AsyncMock()
+
+        result = await translator.how_many_languages_are_in_text("Hello world")
+
+        assert result == 1
+        translator.client.chat.completions.create.assert_not_called()